@@ -1,13 +1,14 @@
 """The ADS-B tar1090 Sensor integration."""
 from __future__ import annotations
 import logging
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import (
-    HomeAssistant
-)
+from typing import TYPE_CHECKING
 from .const import DOMAIN
-PLATFORMS: list[Platform] = [Platform.SENSOR]
+if TYPE_CHECKING:
+    # Only needed for type hints.
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.const import Platform
+    from homeassistant.core import HomeAssistant
+PLATFORMS: list[Platform | str] = ["sensor"]
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,18 +25,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.debug("Config data %s", str(entry))
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = entry.data
-    hass.async_create_task(
-        hass.config_entries.async_forward_entry_setup(entry, "sensor")
-    )
+    # Reload the entry when the options are updated.
+    entry.async_on_unload(entry.add_update_listener(update_listener))
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    if unload_ok := await hass.config_entries.async_unload_platforms(entry, "sensor"):
+    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
-
-    # Remove options update_listener.
-    #entry_data["unsub_update_listener"]()
     return unload_ok
 
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
@@ -0,0 +1,200 @@
+"""Command-line tool to profile the ADS-B data pipeline outside of Home Assistant.
+
+Polls a live tar1090 receiver or replays a capture file through the same
+ConnectionHub/FlightManager pipeline the sensors use, and prints per-stage
+timings, aircraft counts and memory usage for each poll.
+
+Usage:
+    python -m custom_components.adsb_tar1090_sensor --url http://host/tar1090/data/aircraft.json
+    python -m custom_components.adsb_tar1090_sensor --file capture.jsonl --polls 100
+
+A capture file is either a single `aircraft.json` or JSON Lines with one
+`aircraft.json` snapshot per line, which are replayed in a loop.
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import logging
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from .connection_hub import ConnectionHub, InvalidData
+from .const import (
+    DEFAULT_DISTANCE_THRESHOLD_KM,
+    DEFAULT_EMERGENCY_SQUAWK,
+    DEFAULT_SPECIAL_SQUAWK,
+    DEFAULT_SQUAWK_EVENT_COOLDOWN_SECONDS
+)
+from .flight_manager import DataParserError
+
+STAGES = ["fetch", "decode", "extract", "distances", "squawk", "phases", "proximity", "output"]
+
+
+def parse_location(value: str) -> tuple:
+    """Parse a `LAT,LON` command-line argument.
+
+    Args:
+        value (str): The location as `LAT,LON`.
+
+    Returns:
+        tuple: Tuple of (latitude, longitude).
+    """
+    try:
+        (latitude, longitude) = (float(part) for part in value.split(","))
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError("Location must be given as LAT,LON.") from exc
+    return (latitude, longitude)
+
+
+def load_capture(path: Path) -> list:
+    """Load the raw `aircraft.json` snapshots of a capture file.
+
+    Args:
+        path (Path): Path to a JSON or JSON Lines capture file.
+
+    Returns:
+        list: The raw snapshots as bytes.
+    """
+    body = path.read_bytes()
+    try:
+        json.loads(body)
+    except ValueError:
+        return [line for line in body.splitlines() if line.strip()]
+    return [body]
+
+
+def print_poll(poll: int, hub: ConnectionHub, elapsed: float, memory: tuple) -> None:
+    """Print the timings and counts of a single poll.
+
+    Args:
+        poll (int): Number of the poll.
+        hub (ConnectionHub): The ConnectionHub after the poll.
+        elapsed (float): Total duration of the poll in seconds.
+        memory (tuple): Current and peak traced memory in bytes.
+    """
+    stages = " ".join(
+        f"{stage}={hub.timings.get(stage, 0) * 1000:.2f}" for stage in STAGES
+    )
+    print(
+        f"poll {poll:>4}: total={elapsed * 1000:.2f}ms {stages} "
+        f"aircraft={hub.aircraft_count} flights={hub.data.get('monitored_flights', 0)} "
+        f"mem={memory[0] / 1024:.0f}KiB peak={memory[1] / 1024:.0f}KiB"
+    )
+
+
+def print_summary(samples: dict) -> None:
+    """Print the median and maximum of each stage over all polls.
+
+    Args:
+        samples (dict): List of durations in seconds keyed by stage.
+    """
+    print("stage        median(ms)   max(ms)")
+    for stage, durations in samples.items():
+        if durations:
+            print(
+                f"{stage:<12} {statistics.median(durations) * 1000:>10.2f} "
+                f"{max(durations) * 1000:>9.2f}"
+            )
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"max RSS: {max_rss / 1024:.1f} MiB")
+
+
+async def run(args: argparse.Namespace) -> int:
+    """Run the requested amount of polls through the pipeline.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+
+    Returns:
+        int: The exit code.
+    """
+    hub = ConnectionHub(
+        args.url or str(args.file),
+        location=args.location,
+        fire_event=lambda event_type, event_data: print(f"event {event_type}: {event_data}"),
+        emergency_squawk=DEFAULT_EMERGENCY_SQUAWK,
+        special_squawk=DEFAULT_SPECIAL_SQUAWK,
+        squawk_event_cooldown=DEFAULT_SQUAWK_EVENT_COOLDOWN_SECONDS,
+        nearby_flight_slots=args.slots,
+        distance_threshold=args.threshold
+    )
+    snapshots = load_capture(args.file) if args.file else []
+    samples = {stage: [] for stage in ["total", *STAGES]}
+    failed_polls = 0
+    tracemalloc.start()
+    for poll in range(args.polls):
+        hub.timings.clear()
+        start = time.perf_counter()
+        succeeded = True
+        if snapshots:
+            try:
+                hub.process_payload(snapshots[poll % len(snapshots)])
+            except (InvalidData, DataParserError) as exc:
+                succeeded = False
+                print(f"poll {poll + 1:>4}: failed to parse snapshot: {exc}")
+        else:
+            # Fetch errors are handled by the hub, the outcome is kept on its status.
+            await hub.async_update()
+            if not hub.last_poll_ok:
+                succeeded = False
+                health = hub.data["receiver_health"]
+                print(
+                    f"poll {poll + 1:>4}: failed to fetch data: "
+                    f"status={hub.data['receiver_status']} circuit={health['circuit']} "
+                    f"consecutive_failures={health['consecutive_failures']}"
+                )
+        if succeeded:
+            elapsed = time.perf_counter() - start
+            samples["total"].append(elapsed)
+            for stage in STAGES:
+                if stage in hub.timings:
+                    samples[stage].append(hub.timings[stage])
+            print_poll(poll + 1, hub, elapsed, tracemalloc.get_traced_memory())
+        else:
+            failed_polls += 1
+        if args.interval and poll + 1 < args.polls:
+            await asyncio.sleep(args.interval)
+    tracemalloc.stop()
+    print_summary(samples)
+    if failed_polls:
+        print(f"failed polls: {failed_polls}")
+    return 0
+
+
+def main() -> int:
+    """Parse the command-line arguments and run the profiler."""
+    parser = argparse.ArgumentParser(
+        prog="python -m custom_components.adsb_tar1090_sensor",
+        description="Profile the ADS-B tar1090 data pipeline against a receiver or capture."
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--url", help="URL of a tar1090 aircraft.json endpoint.")
+    source.add_argument("--file", type=Path, help="Capture file (JSON or JSON Lines).")
+    parser.add_argument("--polls", type=int, default=10, help="Amount of polls to run.")
+    parser.add_argument(
+        "--interval", type=float, default=None,
+        help="Seconds between polls. Defaults to 1 for --url and 0 for --file."
+    )
+    parser.add_argument(
+        "--location", type=parse_location,
+        help="Receiver location as LAT,LON for distance calculations."
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_DISTANCE_THRESHOLD_KM,
+        help="Distance threshold in km for proximity events."
+    )
+    parser.add_argument("--slots", type=int, default=0, help="Nearby flight slots to assign.")
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging.")
+    args = parser.parse_args()
+    if args.interval is None:
+        args.interval = 1.0 if args.url else 0.0
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.WARNING)
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,10 +18,17 @@ from .const import (
     CONF_DISTANCE_THRESHOLD,
     CONF_EMERGENCY_SQUAWK,
     CONF_SPECIAL_SQUAWK,
+    CONF_SQUAWK_EVENT_COOLDOWN,
+    CONF_NEARBY_FLIGHT_SLOTS,
+    CONF_PROXIMITY_EVENT_COOLDOWN,
     DEFAULT_UPDATE_INTERVAL_SECONDS,
     DEFAULT_DISTANCE_THRESHOLD_KM,
     DEFAULT_EMERGENCY_SQUAWK,
     DEFAULT_SPECIAL_SQUAWK,
+    DEFAULT_SQUAWK_EVENT_COOLDOWN_SECONDS,
+    DEFAULT_NEARBY_FLIGHT_SLOTS,
+    MAX_NEARBY_FLIGHT_SLOTS,
+    DEFAULT_PROXIMITY_EVENT_COOLDOWN_SECONDS,
     DOMAIN,
 )
 
@@ -38,8 +45,7 @@ async def validate_input(data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user URL input."""
     url = data.get("url")
     if url:
-        hub = ConnectionHub(hass=None, endpoint_url=url)
-        if not await hub.test_connect():
+        if not await ConnectionHub.probe(url):
             raise CannotConnect
     # Return info that you want to store in the config entry.
     return {}
@@ -117,32 +123,55 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     vol.Required(
                         CONF_UPDATE_INTERVAL,
                         default=options.get(
-                            "upate_interval",
+                            CONF_UPDATE_INTERVAL,
                             DEFAULT_UPDATE_INTERVAL_SECONDS
                         )
                     ): cv.positive_int,
                     vol.Optional(
                         CONF_DISTANCE_THRESHOLD,
                         default=options.get(
-                            "distance_threshold",
+                            CONF_DISTANCE_THRESHOLD,
                             DEFAULT_DISTANCE_THRESHOLD_KM
                         ),
                     ): cv.positive_float,
                     vol.Optional(
                         CONF_EMERGENCY_SQUAWK,
                         default=options.get(
-                            "emergency_squawk",
+                            CONF_EMERGENCY_SQUAWK,
                             DEFAULT_EMERGENCY_SQUAWK
                         ),
                     ): cv.ensure_list,
                     vol.Optional(
                         CONF_SPECIAL_SQUAWK,
                         default=options.get(
-                            "special_squawk",
+                            CONF_SPECIAL_SQUAWK,
                             DEFAULT_SPECIAL_SQUAWK
                         ),
                     ): cv.ensure_list,
-
+                    vol.Optional(
+                        CONF_SQUAWK_EVENT_COOLDOWN,
+                        default=options.get(
+                            CONF_SQUAWK_EVENT_COOLDOWN,
+                            DEFAULT_SQUAWK_EVENT_COOLDOWN_SECONDS
+                        ),
+                    ): cv.positive_int,
+                    vol.Optional(
+                        CONF_NEARBY_FLIGHT_SLOTS,
+                        default=options.get(
+                            CONF_NEARBY_FLIGHT_SLOTS,
+                            DEFAULT_NEARBY_FLIGHT_SLOTS
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=0, max=MAX_NEARBY_FLIGHT_SLOTS)
+                    ),
+                    vol.Optional(
+                        CONF_PROXIMITY_EVENT_COOLDOWN,
+                        default=options.get(
+                            CONF_PROXIMITY_EVENT_COOLDOWN,
+                            DEFAULT_PROXIMITY_EVENT_COOLDOWN_SECONDS
+                        ),
+                    ): cv.positive_int,
                 }
             ),
         )
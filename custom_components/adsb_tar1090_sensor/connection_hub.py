@@ -2,19 +2,102 @@
 from __future__ import annotations
 import logging
 import asyncio
+import time
+from typing import Callable
 import aiohttp
-from homeassistant.exceptions import HomeAssistantError
+from yarl import URL
+try:
+    # orjson ships with Home Assistant and decodes large payloads much faster.
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+try:
+    from homeassistant.exceptions import HomeAssistantError
+except ImportError:
+    # Running outside of Home Assistant, e.g. in the command-line tool.
+    HomeAssistantError = Exception
 #from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from .flight_manager import FlightManager
+from .const import (
+    DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+    DEFAULT_DISTANCE_THRESHOLD_KM,
+    DEFAULT_PROXIMITY_EVENT_COOLDOWN_SECONDS,
+    DEFAULT_CIRCUIT_RESET_SECONDS,
+    DEFAULT_HEALTH_WINDOW,
+    DEFAULT_NEARBY_FLIGHT_SLOTS,
+    DEFAULT_PROBE_TIMEOUT_SECONDS,
+    DEFAULT_SQUAWK_EVENT_COOLDOWN_SECONDS
+)
+from .flight_manager import FlightManager, DataParserError
+from .flight_phase import FlightPhaseClassifier, PHASES
+from .flight_slots import FlightSlotPool
+from .projection import (
+    FEATURE_FLIGHT_PHASE,
+    FEATURE_NEAREST_FLIGHT,
+    FEATURE_SQUAWK,
+    build_projection
+)
+from .proximity import ProximityScheduler
+from .resilience import CircuitBreaker, HealthMetrics, CIRCUIT_OPEN
+from .squawk_events import SquawkEventTracker
 _LOGGER = logging.getLogger(__name__)
 
 class ConnectionHub:
     """Connection class to verify ADS-B tar1090 API connection."""
 
-    def __init__(self, hass, endpoint_url: str) -> None:
-        """Initialize."""
-        self.hass = hass
+    def __init__(
+        self,
+        endpoint_url: str,
+        location: tuple | None = None,
+        fire_event: Callable[[str, dict], None] | None = None,
+        emergency_squawk: list | None = None,
+        special_squawk: list | None = None,
+        squawk_event_cooldown: float = DEFAULT_SQUAWK_EVENT_COOLDOWN_SECONDS,
+        nearby_flight_slots: int = DEFAULT_NEARBY_FLIGHT_SLOTS,
+        distance_threshold: float = DEFAULT_DISTANCE_THRESHOLD_KM,
+        proximity_event_cooldown: float = DEFAULT_PROXIMITY_EVENT_COOLDOWN_SECONDS
+    ) -> None:
+        """Initialize.
+
+        The hub does not depend on Home Assistant. The integration passes the
+        home location and `hass.bus.async_fire`, the command-line tool its own.
+
+        Args:
+            endpoint_url (str): The URL to the `aircraft.json` endpoint.
+            location (tuple | None): The (latitude, longitude) distances are measured from.
+            fire_event (Callable[[str, dict], None] | None): Called with the event type
+            and event data for each event to fire.
+            emergency_squawk (list | None): Squawk codes considered an emergency.
+            special_squawk (list | None): Squawk codes considered special.
+            squawk_event_cooldown (float): Minimum seconds between squawk events of an aircraft.
+            nearby_flight_slots (int): Amount of nearby flight slots to assign.
+            distance_threshold (float): Distance in km for proximity events.
+            proximity_event_cooldown (float): Minimum seconds between proximity events
+            of an aircraft.
+        """
         self.url = endpoint_url
+        self.location = location
+        self.fire_event = fire_event
+        self._data = {}
+        self.timings = {}
+        self.aircraft_count = 0
+        self.emergency_squawk = emergency_squawk
+        self.special_squawk = special_squawk
+        self.squawk_events = SquawkEventTracker(squawk_event_cooldown)
+        self.flight_slots = FlightSlotPool(nearby_flight_slots)
+        self.flight_phases = FlightPhaseClassifier()
+        self.proximity = ProximityScheduler(distance_threshold, proximity_event_cooldown)
+        self.projection = build_projection(
+            {FEATURE_NEAREST_FLIGHT, FEATURE_SQUAWK, FEATURE_FLIGHT_PHASE}
+        )
+        self.circuit_breaker = CircuitBreaker(
+            DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+            DEFAULT_CIRCUIT_RESET_SECONDS
+        )
+        self.health = HealthMetrics(DEFAULT_HEALTH_WINDOW)
+        self.skipped_records = 0
+        self.suppressed_writes = 0
+        self.last_success: float | None = None
+        self.last_poll_ok = False
 
     @property
     def url(self) -> str:
@@ -50,27 +133,179 @@ class ConnectionHub:
         Args:
             response_data (dict): The response JSON data dictionary.
         """
-        flight_data = FlightManager(self.hass, response_data)
-        self._data = flight_data.output_data()
+        flight_data = FlightManager(
+            self.location,
+            response_data,
+            self.emergency_squawk,
+            self.special_squawk,
+            self.projection
+        )
+        self.timings.update(flight_data.timings)
+        self.skipped_records = flight_data.skipped_records
+        self.aircraft_count = len(response_data.get("aircraft") or [])
+        start = time.perf_counter()
+        timestamp = response_data.get("now")
+        if not isinstance(timestamp, (int, float)):
+            timestamp = time.time()
+        phases = self.flight_phases.classify(flight_data.get_all_flights(), timestamp)
+        self.timings["phases"] = time.perf_counter() - start
+        start = time.perf_counter()
+        data = flight_data.output_data()
+        for phase in PHASES:
+            data[f"flights_{phase}"] = 0
+        for phase in phases.values():
+            if phase in PHASES:
+                data[f"flights_{phase}"] += 1
+        self.fire_squawk_events(flight_data.squawk_alerts)
+        self.fire_proximity_events(flight_data, timestamp)
+        data["squawk_alerts"] = list(self.squawk_events.active.values())
+        if self.flight_slots.size:
+            nearest_flights = flight_data.get_nearest_flights(self.flight_slots.size)
+            for flight in nearest_flights:
+                flight["phase"] = phases.get(flight["hex"])
+            data["flight_slots"] = self.flight_slots.assign(nearest_flights)
+        self._data = data
+        self.timings["output"] = time.perf_counter() - start
+
+    def fire_squawk_events(self, squawk_alerts: dict) -> None:
+        """Fires deduplicated squawk events on the Home Assistant event bus.
+
+        Args:
+            squawk_alerts (dict): Alerting aircraft keyed by ICAO hex address.
+        """
+        for event_type, event_data in self.squawk_events.update(squawk_alerts):
+            _LOGGER.debug("Firing %s: %s", event_type, event_data)
+            if self.fire_event:
+                self.fire_event(event_type, event_data)
+
+    def fire_proximity_events(self, flight_data: FlightManager, timestamp: float) -> None:
+        """Fires an event for each aircraft crossing the distance threshold.
+        Aircraft without a callsign are included with an empty flight number.
+
+        Args:
+            flight_data (FlightManager): The flights of the current poll.
+            timestamp (float): Epoch timestamp of the poll in seconds.
+        """
+        start = time.perf_counter()
+        aircraft = {}
+        for flight_number, distance in flight_data.distances.items():
+            flight = flight_data.get_flight(flight_number)
+            if flight:
+                aircraft[flight.hex] = (flight_number, distance, flight.ground_speed)
+        for hex_id, distance in flight_data.unidentified_distances.items():
+            flight = flight_data.unidentified_flights[hex_id]
+            aircraft[hex_id] = (None, distance, flight.ground_speed)
+        for event_type, event_data in self.proximity.update(aircraft, timestamp):
+            _LOGGER.debug("Firing %s: %s", event_type, event_data)
+            if self.fire_event:
+                self.fire_event(event_type, event_data)
+        self.timings["proximity"] = time.perf_counter() - start
 
     async def async_update(self):
-        """The update method that gets called by Home Assistant to refresh the data. """
+        """The update method that gets called by Home Assistant to refresh the data.
+
+        While the circuit breaker is open the receiver is not contacted. On failure
+        the last good data is kept and served together with its age.
+        """
+        now = time.monotonic()
+        self.last_poll_ok = False
+        if not self.circuit_breaker.allow_request(now):
+            self.health.record_error("circuit_open")
+        else:
+            try:
+                start = time.perf_counter()
+                body = await self.fetch_raw()
+                self.timings["fetch"] = time.perf_counter() - start
+                self.process_payload(body)
+            except DataParserError as exc:
+                # The receiver responded, so this does not count against the circuit.
+                _LOGGER.error("Error parsing data: %s", exc)
+                self.health.record_error("parse")
+            except (
+                CannotConnect,
+                InvalidData,
+                GeneralProblem
+             ) as exc:
+                _LOGGER.error("Error fetching data: %s", exc)
+                self.circuit_breaker.record_failure(now)
+                self.health.record_error(FAILURE_CLASSES[type(exc)])
+            else:
+                self.circuit_breaker.record_success()
+                self.health.record_success(self.skipped_records)
+                self.last_success = now
+                self.last_poll_ok = True
+        self.update_status(now)
+
+    def update_status(self, now: float) -> None:
+        """Adds the receiver status, data age and health metrics to the data.
+
+        Args:
+            now (float): Monotonic timestamp of the poll.
+        """
+        circuit = self.circuit_breaker.state(now)
+        if self.last_poll_ok:
+            status = "ok"
+        elif circuit == CIRCUIT_OPEN:
+            status = "circuit_open"
+        elif self.last_success is not None:
+            status = "stale"
+        else:
+            status = "unavailable"
+        self._data = {
+            **self._data,
+            "receiver_status": status,
+            "receiver_health": {
+                **self.health.as_dict(),
+                "data_age": (
+                    None if self.last_poll_ok or self.last_success is None
+                    else round(now - self.last_success)
+                ),
+                "circuit": circuit,
+                "consecutive_failures": self.circuit_breaker.consecutive_failures,
+                "suppressed_writes": self.suppressed_writes,
+                "slot_reassignments": self.flight_slots.reassignments
+            }
+        }
+
+    def process_payload(self, body: bytes) -> None:
+        """Decodes a raw `aircraft.json` payload and runs it through the pipeline.
+
+        Args:
+            body (bytes): The raw `aircraft.json` payload.
+        """
+        start = time.perf_counter()
+        response_data = self.decode(body)
+        self.timings["decode"] = time.perf_counter() - start
+        self.data = response_data
+
+    @staticmethod
+    def decode(body: bytes) -> dict:
+        """Decodes a raw JSON payload.
+
+        Args:
+            body (bytes): The raw JSON payload.
+
+        Raises:
+            InvalidData: The payload is not a JSON object.
+
+        Returns:
+            dict: The decoded payload.
+        """
         try:
-            self.data = await self.fetch_data()
-        except (
-            CannotConnect,
-            InvalidData,
-            GeneralProblem
-         ) as exc:
-            _LOGGER.error("Error fetching data: %s", exc)
-
-    async def fetch_data(self) -> dict:
-        """Connects to a URL and returns the JSON data."""
+            response_data = json_loads(body)
+        except ValueError as exc:
+            raise InvalidData("The payload is not valid JSON.") from exc
+        if not isinstance(response_data, dict):
+            raise InvalidData("The payload is not a JSON object.")
+        return response_data
+
+    async def fetch_raw(self) -> bytes:
+        """Connects to a URL and returns the raw response payload."""
         try:
             async with aiohttp.ClientSession() as session:
                 response = await session.get(self.url)
                 response.raise_for_status()
-                return await response.json()
+                return await response.read()
         except (
             asyncio.TimeoutError,
             aiohttp.ClientConnectionError,
@@ -101,19 +336,55 @@ class ConnectionHub:
                     "General error connecting to ADS-B receiver endpoint"
                 ) from exc
 
-    async def test_connect(self) -> bool:
-        """Test if we can connect to the API endpoint."""
+    @staticmethod
+    def receiver_url(endpoint_url: str) -> str | None:
+        """Returns the URL of the `receiver.json` next to an `aircraft.json` endpoint.
+
+        Args:
+            endpoint_url (str): The URL to the HTTP(s) endpoint.
+
+        Returns:
+            str | None: The `receiver.json` URL or None if the endpoint is not an `aircraft.json`.
+        """
+        url = URL(endpoint_url)
+        if not url.path.endswith("/aircraft.json"):
+            return None
+        return str(url.with_path(url.path[:-len("aircraft.json")] + "receiver.json"))
+
+    @staticmethod
+    async def probe(endpoint_url: str, timeout: float = DEFAULT_PROBE_TIMEOUT_SECONDS) -> bool:
+        """Lightweight check that the endpoint is a reachable tar1090 receiver.
+
+        Fetches the small `receiver.json` instead of the full `aircraft.json`.
+        If there is no `receiver.json`, a HEAD request is sent to the endpoint URL.
+        No ConnectionHub is needed, so the config flow can probe a URL on its own.
+
+        Args:
+            endpoint_url (str): The URL to the HTTP(s) endpoint.
+            timeout (float): Total timeout of the probe in seconds.
+
+        Raises:
+            CannotConnect: The endpoint is not reachable or not compatible.
+
+        Returns:
+            bool: True if the endpoint is reachable.
+        """
         try:
-            data = await self.fetch_data()
-            _LOGGER.debug("ADS-B Data: %s", data)
-            if 'aircraft' not in data.keys():
-                raise InvalidData(
-                    "Connection to endpoint established but response data is not compatible."
-                    )
+            async with aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as session:
+                receiver_url = ConnectionHub.receiver_url(endpoint_url)
+                if receiver_url:
+                    async with session.get(receiver_url) as response:
+                        if response.status == 200:
+                            receiver = await response.json(content_type=None)
+                            if isinstance(receiver, dict) and "version" in receiver:
+                                _LOGGER.debug("ADS-B receiver: %s", receiver)
+                                return True
+                async with session.head(endpoint_url) as response:
+                    response.raise_for_status()
         except Exception as exc:
             raise CannotConnect("Failed to connect to endpoint.") from exc
-        # Graceful shutdown
-        await asyncio.sleep(0)
         return True
 
 class CannotConnect(HomeAssistantError):
@@ -124,3 +395,9 @@ class InvalidData(HomeAssistantError):
 
 class GeneralProblem(HomeAssistantError):
     """Error to indicate that the endpoint is not compatible with this sensor."""
+
+FAILURE_CLASSES = {
+    CannotConnect: "cannot_connect",
+    InvalidData: "invalid_data",
+    GeneralProblem: "general"
+}
@@ -8,6 +8,9 @@ CONF_DISTANCE_THRESHOLD = "distance_threshold"
 CONF_EMERGENCY_SQUAWK = "emergency_squawk"
 CONF_SPECIAL_SQUAWK = "special_squawk"
 CONF_SENSORS = "sensors"
+CONF_SQUAWK_EVENT_COOLDOWN = "squawk_event_cooldown"
+CONF_NEARBY_FLIGHT_SLOTS = "nearby_flight_slots"
+CONF_PROXIMITY_EVENT_COOLDOWN = "proximity_event_cooldown"
 
 #"""Default Config values"""
 #DEFAULT_URL = str("http://adsbexchange.local/tar1090/data/aircraft.json")
@@ -17,3 +20,17 @@ DEFAULT_UPDATE_INTERVAL_SECONDS = 60
 DEFAULT_DISTANCE_THRESHOLD_KM = 10
 DEFAULT_EMERGENCY_SQUAWK = [7500,7600,7700]
 DEFAULT_SPECIAL_SQUAWK = [7100]
+DEFAULT_SQUAWK_EVENT_COOLDOWN_SECONDS = 300
+DEFAULT_PROXIMITY_EVENT_COOLDOWN_SECONDS = 300
+DEFAULT_NEARBY_FLIGHT_SLOTS = 0
+DEFAULT_PROBE_TIMEOUT_SECONDS = 5
+DEFAULT_CIRCUIT_FAILURE_THRESHOLD = 3
+DEFAULT_CIRCUIT_RESET_SECONDS = 300
+DEFAULT_HEALTH_WINDOW = 100
+MAX_NEARBY_FLIGHT_SLOTS = 10
+
+"""Events fired on the Home Assistant event bus"""
+EVENT_SQUAWK_STARTED = f"{DOMAIN}_squawk_started"
+EVENT_SQUAWK_ENDED = f"{DOMAIN}_squawk_ended"
+EVENT_PROXIMITY_ENTERED = f"{DOMAIN}_proximity_entered"
+EVENT_PROXIMITY_EXITED = f"{DOMAIN}_proximity_exited"
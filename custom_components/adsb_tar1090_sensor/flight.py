@@ -4,19 +4,37 @@ based on the information received from the ADS-B receiver.
 
 """
 from __future__ import annotations
-from .squawk_codes import SQUAWK_CODES
 
 class Flight:
     """Holds details of currently monitored aircraft."""
+    __slots__ = (
+        "flight_number",
+        "hex",
+        "ground_speed",
+        "vertical_rate",
+        "baro_altitude",
+        "_squawk",
+        "_altitude",
+        "_speed",
+        "_location",
+        "_alert",
+        "_emergency"
+    )
+
     def __init__(self, flight_number, flight_data: dict) -> None:
         """Initialize the Aircraft object.
+        The aircraft data is not kept, only the parsed values.
 
         Args:
-            flight_data (dict): A dictionary containing aircraft data.
+            flight_number (str): The stripped flight number the flight is tracked under.
+            flight_data (dict): A dictionary containing the projected aircraft data.
         """
         self.flight_number = flight_number
-        self.data = flight_data
-        self.parse_data()
+        self.hex = None
+        self.ground_speed = None
+        self.vertical_rate = None
+        self.baro_altitude = None
+        self.parse_data(flight_data)
 
     @property
     def squawk(self) -> tuple|None:
@@ -38,6 +56,8 @@ class Flight:
             code (str | None): The squawk code to set.
         """
         if code:
+            # The lookup table is large, load it when the first squawk is seen.
+            from .squawk_codes import SQUAWK_CODES  # pylint: disable=import-outside-toplevel
             description = SQUAWK_CODES.get(code)
             self._squawk = (code, description)
         else:
@@ -103,10 +123,20 @@ class Flight:
         """
         (self._alert, self._emergency) = alert_emergency
 
-    def parse_data(self):
-        """Parses and processes the local ADS-B data."""
-        self.squawk = self.data.get("squawk")
-        self.flight_number = self.data.get("flight")
-        self.parameters = (self.data.get("alt_geom"), self.data.get("mach"))
-        self.location = (self.data.get("lat"), self.data.get("lon"))
-        self.alert = (self.data.get("alert"), self.data.get("emergency"))
+    def parse_data(self, flight_data: dict):
+        """Parses and processes the local ADS-B data.
+
+        Args:
+            flight_data (dict): A dictionary containing the projected aircraft data.
+        """
+        self.squawk = flight_data.get("squawk")
+        self.hex = flight_data.get("hex") or self.flight_number
+        self.parameters = (flight_data.get("alt_geom"), flight_data.get("mach"))
+        self.location = (flight_data.get("lat"), flight_data.get("lon"))
+        self.alert = (flight_data.get("alert"), flight_data.get("emergency"))
+        self.ground_speed = flight_data.get("gs")
+        self.baro_altitude = flight_data.get("alt_baro")
+        vertical_rate = flight_data.get("baro_rate")
+        if vertical_rate is None:
+            vertical_rate = flight_data.get("geom_rate")
+        self.vertical_rate = vertical_rate
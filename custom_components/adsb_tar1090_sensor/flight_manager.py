@@ -5,32 +5,62 @@ on the information received from the ADS-B receiver.
 """
 from __future__ import annotations
 import logging
-import haversine
-from homeassistant.const import (
-    ATTR_LATITUDE,
-    ATTR_LONGITUDE
-    )
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import HomeAssistantError
+import heapq
+import time
+from operator import itemgetter
+try:
+    from homeassistant.exceptions import HomeAssistantError
+except ImportError:
+    # Running outside of Home Assistant, e.g. in the command-line tool.
+    HomeAssistantError = Exception
+from .const import (
+    DEFAULT_EMERGENCY_SQUAWK,
+    DEFAULT_SPECIAL_SQUAWK
+)
 from .flight import Flight
+from .projection import FEATURE_FIELDS, build_projection, project
 _LOGGER = logging.getLogger(__name__)
 
 class FlightManager:
     """Connection class to verify ADS-B tar1090 API connection."""
 
-    def __init__(self, hass: HomeAssistant, adsb_data: dict) -> None:
+    def __init__(
+        self,
+        location: tuple | None,
+        adsb_data: dict,
+        emergency_squawk: list | None = None,
+        special_squawk: list | None = None,
+        projection: tuple | None = None
+    ) -> None:
         """Initialize the FlightData class.
 
         Args:
-            hass (HomeAssistant): The Home Assistance object instance.
+            location (tuple | None): The (latitude, longitude) distances are measured from.
             adsb_data (dict): The `aircraft.json` response data.
+            emergency_squawk (list | None): Squawk codes considered an emergency.
+            Defaults to `DEFAULT_EMERGENCY_SQUAWK`.
+            special_squawk (list | None): Squawk codes considered special.
+            Defaults to `DEFAULT_SPECIAL_SQUAWK`.
+            projection (tuple | None): The aircraft fields to extract, see `build_projection`.
+            Defaults to the fields of all features.
         """
-        self.hass = hass
-        self.location = self.get_location()
+        self.location = location
+        self.projection = projection or build_projection(set(FEATURE_FIELDS))
+        self.emergency_squawk = FlightManager.normalize_squawk_codes(
+            DEFAULT_EMERGENCY_SQUAWK if emergency_squawk is None else emergency_squawk
+        )
+        self.special_squawk = FlightManager.normalize_squawk_codes(
+            DEFAULT_SPECIAL_SQUAWK if special_squawk is None else special_squawk
+        )
         self.active_flights = {}
-        self.adsb_data = adsb_data
+        self.unidentified_flights = {}
         self.distances = {}
+        self.unidentified_distances = {}
         self.emergencies = {}
+        self.squawk_alerts = {}
+        self.timings = {}
+        self.skipped_records = 0
+        self.adsb_data = adsb_data
 
     @property
     def adsb_data(self) -> dict:
@@ -68,57 +98,114 @@ class FlightManager:
             DataParserError: Failed to parse the aircraft data.
         """
         self.message_count = self.adsb_data.get('messages',0)
-        self.extract_flight_data()
-        self.calculate_distances()
-        self.analyze_squawk()
+        for stage, process in (
+            ("extract", self.extract_flight_data),
+            ("distances", self.calculate_distances),
+            ("squawk", self.analyze_squawk)
+        ):
+            start = time.perf_counter()
+            process()
+            self.timings[stage] = time.perf_counter() - start
 
     def extract_flight_data(self):
         """Extract the aircraft data from the ADS-B data.
            Process each flight and update the class property values.
+           Only the projected fields are extracted from each aircraft record.
+           Aircraft without a callsign are kept by hex address for the squawk analysis.
+           Malformed aircraft records are skipped and counted.
+
+        Raises:
+            DataParserError: The ADS-B data has no list of aircraft.
         """
         aircrafts = self.adsb_data.get("aircraft")
-        if aircrafts:
-            for flight_data in aircrafts:
-                flight_number = flight_data.get("flight", "").rstrip()
+        if not isinstance(aircrafts, list):
+            raise DataParserError("Failed to parse the aircraft data.")
+        projection = self.projection
+        for record in aircrafts:
+            try:
+                flight_data = project(record, projection)
+                flight_number = (flight_data["flight"] or "").rstrip()
                 if flight_number != "":
                     self.add_flight(flight_number, flight_data)
-        else:
-            raise DataParserError("Failed to parse the aircraft data.")
+                elif flight_data["hex"]:
+                    self.unidentified_flights[flight_data["hex"]] = Flight(None, flight_data)
+            except (AttributeError, TypeError, ValueError) as exc:
+                self.skip_record(record, exc)
 
     def calculate_distances(self):
         """Iterates over all current flights and calculates the distance (in km) between
         the flight and your position.
+        Distances of aircraft without a callsign are kept apart by hex address.
         """
-        for flight in self.get_all_flights():
+        for flight in [*self.active_flights.values(), *self.unidentified_flights.values()]:
             if flight.location and self.location:
-                distance = FlightManager.haversine_distance(self.location, flight.location)
+                try:
+                    distance = FlightManager.haversine_distance(self.location, flight.location)
+                except (TypeError, ValueError) as exc:
+                    if flight.flight_number:
+                        self.remove_flight(flight.flight_number)
+                    else:
+                        del self.unidentified_flights[flight.hex]
+                    self.skip_record(flight.hex, exc)
+                    continue
                 if distance and isinstance(distance, float):
-                    self.distances[flight.flight_number] = distance
+                    if flight.flight_number:
+                        self.distances[flight.flight_number] = distance
+                    else:
+                        self.unidentified_distances[flight.hex] = distance
+
+    def skip_record(self, flight_data, exc: Exception) -> None:
+        """Counts a malformed aircraft record that is left out of the results.
+
+        Args:
+            flight_data: The malformed item from the `aircraft` list or its hex address.
+            exc (Exception): The error raised while processing the record.
+        """
+        self.skipped_records += 1
+        _LOGGER.debug("Skipping malformed aircraft record %s: %s", flight_data, exc)
 
     def analyze_squawk(self):
         """Iterates over all current flights and searches for flights with an emergency
-        transponder code set.
-        """
-        for flight in self.get_all_flights():
-            if flight.squawk:
-                (code, description) = flight.squawk
-                #TODO: get emergency squawk from configuration.
-                if code in [7500,7600,7700]:
-                    _LOGGER.debug(
-                        "Flight %s has set emergency squawk code %s - %s!",
-                        flight.flight_number,
-                        code,
-                        description
-                    )
-                    self.emergencies[flight.flight_number] = flight.squawk
+        or special transponder code set, or with the `emergency`/`alert` flags raised.
+        Aircraft without a callsign are included and listed by their hex address.
+        """
+        for flight in [*self.active_flights.values(), *self.unidentified_flights.values()]:
+            (code, description) = flight.squawk or (None, None)
+            (alert, emergency) = flight.alert
+            if emergency == "none":
+                emergency = None
+            if code in self.emergency_squawk or emergency:
+                category = "emergency"
+                _LOGGER.debug(
+                    "Flight %s has set emergency squawk code %s - %s!",
+                    flight.flight_number or flight.hex,
+                    code,
+                    description
+                )
+                self.emergencies[flight.flight_number or flight.hex] = flight.squawk
+            elif code in self.special_squawk:
+                category = "special"
+            elif alert:
+                category = "alert"
+            else:
+                continue
+            self.squawk_alerts[flight.hex] = {
+                "hex": flight.hex,
+                "flight": flight.flight_number,
+                "category": category,
+                "squawk": code,
+                "description": description,
+                "emergency": emergency,
+                "alert": bool(alert)
+            }
 
     def add_flight(self, flight_number: str, flight_data: dict) -> None:
         """Adds a Flight object to the list of active flights.
 
         Args:
             flight_number (str): The flight number, such as 'AFR564' or similar.
-            flight_data (dict): A single item from the list of dicts under
-            the `aircraft` key inside `aircraft.json`.
+            flight_data (dict): The projected fields of a single item from the list
+            of dicts under the `aircraft` key inside `aircraft.json`.
         """
         flight = Flight(flight_number, flight_data)
         self.active_flights[flight_number] = flight
@@ -157,12 +244,38 @@ class FlightManager:
         Returns:
             tuple | None: Tuple of flight number and distance or None if no flights..
         """
-        nearest_flight_number = min(self.distances.values(), default=None)
-        if nearest_flight_number:
-            nearest_flight_distance = self.distances[nearest_flight_number]
-            return (nearest_flight_number, nearest_flight_distance)
-        else:
-            return None
+        return min(self.distances.items(), key=itemgetter(1), default=None)
+
+    def get_nearest_flights(self, count: int) -> list:
+        """Rank the nearest flights and return their details, nearest first.
+
+        Args:
+            count (int): Maximum amount of flights to return.
+
+        Returns:
+            list: List of flight detail dictionaries ordered by distance.
+        """
+        nearest_flights = []
+        for flight_number, distance in heapq.nsmallest(
+            count, self.distances.items(), key=itemgetter(1)
+        ):
+            flight = self.get_flight(flight_number)
+            if not flight:
+                continue
+            (altitude, _) = flight.parameters
+            (latitude, longitude) = flight.location or (None, None)
+            (squawk, _) = flight.squawk or (None, None)
+            nearest_flights.append({
+                "hex": flight.hex,
+                "flight": flight_number,
+                "latitude": latitude,
+                "longitude": longitude,
+                "altitude": altitude,
+                "speed": flight.ground_speed,
+                "squawk": squawk,
+                "distance": distance
+            })
+        return nearest_flights
 
     def output_data(self) -> dict:
         """Returns the output data required by the Home Assistant ADS-B Sensor.
@@ -178,7 +291,7 @@ class FlightManager:
             (nearest_flight, nearest_flight_distance) = nearest_flight_data
             flight = self.get_flight(nearest_flight)
             if flight:
-                (nearest_flight_speed, nearest_flight_altitude) = flight.parameters
+                (nearest_flight_altitude, nearest_flight_speed) = flight.parameters
             else:
                 nearest_flight_speed = None
                 nearest_flight_altitude = None
@@ -191,6 +304,7 @@ class FlightManager:
         return {
             "message_count": self.message_count,
             "monitored_flights": len(self.active_flights),
+            "flights": sorted(self.active_flights),
             "emergencies": len(self.emergencies),
             "nearest_flight": nearest_flight,
             "nearest_flight_distance": nearest_flight_distance,
@@ -198,6 +312,18 @@ class FlightManager:
             "nearest_flight_speed": nearest_flight_speed
         }
 
+    @staticmethod
+    def normalize_squawk_codes(codes: list) -> set:
+        """Normalize configured squawk codes to the 4-digit strings used by `aircraft.json`.
+
+        Args:
+            codes (list): List of squawk codes as integers or strings.
+
+        Returns:
+            set: Set of 4-digit squawk code strings.
+        """
+        return {str(code).strip().zfill(4) for code in codes if str(code).strip()}
+
     @staticmethod
     def haversine_distance(coord1: tuple, coord2: tuple) -> float:
         """
@@ -215,41 +341,10 @@ class FlightManager:
             float: The haversine distance between the two coordinates in kilometers,
             rounded to two decimal places.
         """
+        # Imported on first use to keep the integration startup fast.
+        import haversine  # pylint: disable=import-outside-toplevel
         distance_km = haversine.haversine(coord1, coord2)
         return round(distance_km,2)
 
-    def get_location(self) -> tuple | None:
-        """Retrieve the latitude and longitude of the Home Assistant installation.
-
-        This function asynchronously fetches the latitude and longitude attributes 
-        of the "sun.sun" entity, which typically represents the location of the 
-        Home Assistant installation.
-
-        Returns:
-            tuple | None: A tuple containing the latitude and longitude of the Home Assistant 
-            installation. If the location is not available, None is returned.
-        """
-        states = self.hass.states.async_all()
-        latitude = next(
-            (
-                state.attributes.get(ATTR_LATITUDE)
-                for state in states
-                if state.entity_id == "sun.sun"
-            ),
-            None
-        )
-        longitude = next(
-            (
-                state.attributes.get(ATTR_LONGITUDE)
-                for state in states
-                if state.entity_id == "sun.sun"
-            ),
-            None
-        )
-        if latitude and longitude:
-            return (latitude, longitude)
-        else:
-            return None
-
 class DataParserError(HomeAssistantError):
     """Error to indicate that data could not be parsed."""
@@ -0,0 +1,114 @@
+"""
+FlightPhaseClassifier class to label each aircraft with its phase of flight
+based on ground speed, vertical rate, altitude and recent altitude samples.
+
+"""
+from __future__ import annotations
+from collections import deque
+
+PHASE_CLIMBING = "climbing"
+PHASE_DESCENDING = "descending"
+PHASE_CRUISING = "cruising"
+PHASE_APPROACH = "approach"
+PHASE_GROUND = "ground"
+PHASE_UNKNOWN = "unknown"
+PHASES = [PHASE_CLIMBING, PHASE_DESCENDING, PHASE_CRUISING, PHASE_APPROACH, PHASE_GROUND]
+
+# Vertical rate in ft/min beyond which an aircraft is not in level flight.
+LEVEL_RATE_FPM = 300
+# Descending aircraft below this altitude in ft are considered on approach.
+APPROACH_ALTITUDE_FT = 10000
+# Aircraft slower than this in kt and below GROUND_ALTITUDE_FT are taxiing.
+GROUND_SPEED_KT = 50
+GROUND_ALTITUDE_FT = 500
+HISTORY_SAMPLES = 5
+
+class FlightPhaseClassifier:
+    """Classifies the phase of flight of all aircraft of a poll at once."""
+
+    def __init__(self) -> None:
+        """Initialize the FlightPhaseClassifier class."""
+        self._history: dict[str, deque] = {}
+
+    def classify(self, flights: list, timestamp: float) -> dict:
+        """Label each aircraft with its phase of flight.
+
+        The attributes of all flights are first gathered into columns, the labels
+        are then derived column-wise in a single pass. If an aircraft reports no
+        vertical rate, it is estimated from the recent barometric altitude samples.
+        The altitude history is kept for the aircraft of this poll only.
+
+        Args:
+            flights (list): All current `Flight` object instances.
+            timestamp (float): Epoch timestamp of the poll in seconds.
+
+        Returns:
+            dict: The phase of flight keyed by ICAO hex address.
+        """
+        hex_ids = [flight.hex for flight in flights]
+        ground_speeds = [flight.ground_speed for flight in flights]
+        altitudes = [flight.baro_altitude for flight in flights]
+        rates = [flight.vertical_rate for flight in flights]
+
+        history = {}
+        for index, hex_id in enumerate(hex_ids):
+            samples = self._history.get(hex_id) or deque(maxlen=HISTORY_SAMPLES)
+            altitude = altitudes[index]
+            if isinstance(altitude, (int, float)):
+                samples.append((timestamp, altitude))
+            if rates[index] is None:
+                rates[index] = FlightPhaseClassifier.estimate_rate(samples)
+            history[hex_id] = samples
+        self._history = history
+
+        return {
+            hex_id: FlightPhaseClassifier.label(ground_speed, altitude, rate)
+            for hex_id, ground_speed, altitude, rate
+            in zip(hex_ids, ground_speeds, altitudes, rates)
+        }
+
+    @staticmethod
+    def estimate_rate(samples: deque) -> float | None:
+        """Estimate the vertical rate from the oldest and newest altitude sample.
+
+        Args:
+            samples (deque): Tuples of (timestamp, altitude in ft).
+
+        Returns:
+            float | None: Vertical rate in ft/min or None if there is too little history.
+        """
+        if len(samples) < 2:
+            return None
+        ((first_time, first_altitude), (last_time, last_altitude)) = (samples[0], samples[-1])
+        if last_time <= first_time:
+            return None
+        return (last_altitude - first_altitude) / (last_time - first_time) * 60
+
+    @staticmethod
+    def label(ground_speed, altitude, rate) -> str:
+        """Derive the phase of flight of a single aircraft.
+
+        Args:
+            ground_speed (float | None): Ground speed in kt.
+            altitude (float | str | None): Barometric altitude in ft or `ground`.
+            rate (float | None): Vertical rate in ft/min.
+
+        Returns:
+            str: The phase of flight.
+        """
+        if altitude == "ground" or (
+            isinstance(ground_speed, (int, float))
+            and isinstance(altitude, (int, float))
+            and ground_speed < GROUND_SPEED_KT
+            and altitude < GROUND_ALTITUDE_FT
+        ):
+            return PHASE_GROUND
+        if not isinstance(rate, (int, float)):
+            return PHASE_UNKNOWN
+        if rate > LEVEL_RATE_FPM:
+            return PHASE_CLIMBING
+        if rate < -LEVEL_RATE_FPM:
+            if isinstance(altitude, (int, float)) and altitude < APPROACH_ALTITUDE_FT:
+                return PHASE_APPROACH
+            return PHASE_DESCENDING
+        return PHASE_CRUISING
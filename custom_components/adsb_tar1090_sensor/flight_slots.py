@@ -0,0 +1,53 @@
+"""
+FlightSlotPool class to map the nearest aircraft onto a fixed
+amount of reusable sensor slots.
+
+"""
+from __future__ import annotations
+
+class FlightSlotPool:
+    """Assigns ranked aircraft to a fixed-size pool of slots with minimal churn."""
+
+    def __init__(self, size: int) -> None:
+        """Initialize the FlightSlotPool class.
+
+        Args:
+            size (int): The amount of slots in the pool.
+        """
+        self.size = size
+        self._slots: list[str | None] = [None] * size
+        self.reassignments = 0
+
+    @property
+    def slots(self) -> list:
+        """Returns the ICAO hex address assigned to each slot.
+
+        Returns:
+            list: ICAO hex addresses, or None for unused slots.
+        """
+        return list(self._slots)
+
+    def assign(self, nearest_flights: list) -> list:
+        """Assign the nearest aircraft to the slots.
+
+        Aircraft that are still among the nearest keep their slot. Freed slots
+        are filled with the newly ranked aircraft, nearest first.
+
+        Args:
+            nearest_flights (list): Flight detail dictionaries ordered by distance,
+            as returned by `FlightManager.get_nearest_flights`.
+
+        Returns:
+            list: The flight details for each slot, or None for unused slots.
+        """
+        ranked = {flight["hex"]: flight for flight in nearest_flights[:self.size]}
+        slots = [hex_id if hex_id in ranked else None for hex_id in self._slots]
+        assigned = set(slots)
+        newcomers = (hex_id for hex_id in ranked if hex_id not in assigned)
+        for index, hex_id in enumerate(slots):
+            if hex_id is None:
+                slots[index] = next(newcomers, None)
+                if slots[index] is not None and self._slots[index] is not None:
+                    self.reassignments += 1
+        self._slots = slots
+        return [ranked.get(hex_id) for hex_id in slots]
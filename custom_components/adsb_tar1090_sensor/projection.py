@@ -0,0 +1,77 @@
+"""
+Declarative projection of the `aircraft.json` fields used by the sensors.
+
+Each feature declares the aircraft fields it reads. Only the fields of the
+enabled features are extracted from an aircraft record and checked against
+their type, everything else in the record is dropped.
+
+"""
+from __future__ import annotations
+
+FEATURE_CORE = "core"
+FEATURE_NEAREST_FLIGHT = "nearest_flight"
+FEATURE_SQUAWK = "squawk"
+FEATURE_FLIGHT_PHASE = "flight_phase"
+
+
+NUMBER = (int, float)
+TEXT = (str,)
+
+# Accepted types per field, values of any other type are replaced by None.
+FIELD_TYPES = {
+    "hex": TEXT,
+    "flight": TEXT,
+    "lat": NUMBER,
+    "lon": NUMBER,
+    "alt_geom": NUMBER,
+    "mach": NUMBER,
+    "squawk": TEXT,
+    "alert": NUMBER,
+    "emergency": TEXT,
+    "gs": NUMBER,
+    # Either the altitude in ft or `ground`.
+    "alt_baro": NUMBER + TEXT,
+    "baro_rate": NUMBER,
+    "geom_rate": NUMBER
+}
+
+FEATURE_FIELDS = {
+    FEATURE_CORE: ("hex", "flight", "lat", "lon"),
+    FEATURE_NEAREST_FLIGHT: ("alt_geom", "mach"),
+    FEATURE_SQUAWK: ("squawk", "alert", "emergency"),
+    FEATURE_FLIGHT_PHASE: ("gs", "alt_baro", "baro_rate", "geom_rate")
+}
+
+
+def build_projection(features: set) -> tuple:
+    """Collect the fields and their types required by the enabled features.
+
+    Args:
+        features (set): The enabled features, see `FEATURE_FIELDS`.
+
+    Returns:
+        tuple: Tuples of (field, accepted types), each field listed once.
+    """
+    fields = {FEATURE_CORE} | set(features)
+    required = dict.fromkeys(
+        field for feature, feature_fields in FEATURE_FIELDS.items() if feature in fields
+        for field in feature_fields
+    )
+    return tuple((field, FIELD_TYPES[field]) for field in required)
+
+
+def project(record: dict, projection: tuple) -> dict:
+    """Extract the projected fields from an aircraft record in a single pass.
+
+    Args:
+        record (dict): A single item of the `aircraft` list inside `aircraft.json`.
+        projection (tuple): Tuples of (field, accepted types) from `build_projection`.
+
+    Returns:
+        dict: The values of the projected fields, None for missing or mistyped values.
+    """
+    get = record.get
+    return {
+        field: value if isinstance(value := get(field), types) else None
+        for field, types in projection
+    }
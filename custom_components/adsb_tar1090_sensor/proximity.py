@@ -0,0 +1,189 @@
+"""
+ProximityScheduler class to detect aircraft entering or leaving the
+distance threshold around the receiver location.
+
+"""
+from __future__ import annotations
+import heapq
+import logging
+from .const import (
+    EVENT_PROXIMITY_ENTERED,
+    EVENT_PROXIMITY_EXITED
+)
+_LOGGER = logging.getLogger(__name__)
+
+KNOTS_TO_KM_PER_SECOND = 1.852 / 3600
+# Assumed ground speed in kt for aircraft that do not report one.
+DEFAULT_GROUND_SPEED_KT = 600
+MIN_REEVALUATION_SECONDS = 5
+MAX_REEVALUATION_SECONDS = 300
+
+class ProximityScheduler:
+    """Evaluates aircraft against the distance threshold only when they could cross it."""
+
+    def __init__(self, threshold_km: float, cooldown: float) -> None:
+        """Initialize the ProximityScheduler class.
+
+        Args:
+            threshold_km (float): The distance threshold around the receiver in km.
+            cooldown (float): Minimum amount of seconds between two events
+            for the same aircraft.
+        """
+        self.threshold_km = threshold_km
+        self.cooldown = cooldown
+        self._queue: list[tuple[float, str]] = []
+        self._due: dict[str, float] = {}
+        self._inside: dict[str, bool] = {}
+        self._flight_numbers: dict[str, str] = {}
+        self._last_event: dict[str, float] = {}
+        self._lost: set[str] = set()
+
+    def update(self, aircraft: dict, now: float) -> list:
+        """Evaluate the aircraft that are new or due for re-evaluation.
+
+        Aircraft that left the feed are handled by `lose` once their re-evaluation
+        is due. A lost aircraft that reappears is evaluated right away.
+
+        Args:
+            aircraft (dict): Tuples of (flight number, distance in km, ground speed in kt)
+            keyed by ICAO hex address.
+            now (float): Timestamp of the poll in seconds.
+
+        Returns:
+            list: List of (event_type, event_data) tuples to fire.
+        """
+        events = []
+        due = dict.fromkeys(
+            hex_id for hex_id in aircraft if hex_id not in self._due or hex_id in self._lost
+        )
+        while self._queue and self._queue[0][0] <= now:
+            (due_time, hex_id) = heapq.heappop(self._queue)
+            if self._due.get(hex_id) != due_time:
+                continue
+            if hex_id in aircraft:
+                due[hex_id] = None
+            else:
+                event = self.lose(hex_id, now)
+                if event:
+                    events.append(event)
+        for hex_id in due:
+            self._lost.discard(hex_id)
+            (flight_number, distance, ground_speed) = aircraft[hex_id]
+            event = self.evaluate(hex_id, flight_number, distance, now)
+            if event:
+                events.append(event)
+            self.schedule(hex_id, distance, ground_speed, now)
+        return events
+
+    def evaluate(self, hex_id: str, flight_number: str, distance: float, now: float):
+        """Check if an aircraft crossed the distance threshold since its last evaluation.
+
+        A crossing within the cooldown of the previous event is not announced
+        and will be picked up again by a later evaluation.
+
+        Args:
+            hex_id (str): ICAO hex address of the aircraft.
+            flight_number (str): The flight number, such as 'AFR564' or similar.
+            distance (float): Current distance to the receiver in km.
+            now (float): Timestamp of the poll in seconds.
+
+        Returns:
+            tuple | None: The (event_type, event_data) tuple or None if nothing changed.
+        """
+        self._flight_numbers[hex_id] = flight_number
+        inside = distance <= self.threshold_km
+        if inside == self._inside.get(hex_id, False):
+            return None
+        if now - self._last_event.get(hex_id, float("-inf")) < self.cooldown:
+            _LOGGER.debug("Suppressing proximity event for %s during cooldown.", hex_id)
+            return None
+        self._inside[hex_id] = inside
+        self._last_event[hex_id] = now
+        return (
+            EVENT_PROXIMITY_ENTERED if inside else EVENT_PROXIMITY_EXITED,
+            {
+                "hex": hex_id,
+                "flight": flight_number,
+                "distance": distance,
+                "threshold": self.threshold_km,
+                "lost": False
+            }
+        )
+
+    def schedule(self, hex_id: str, distance: float, ground_speed, now: float) -> None:
+        """Schedule the next evaluation for when the aircraft could reach the threshold.
+
+        Args:
+            hex_id (str): ICAO hex address of the aircraft.
+            distance (float): Current distance to the receiver in km.
+            ground_speed (float | None): Ground speed in kt.
+            now (float): Timestamp of the poll in seconds.
+        """
+        if not isinstance(ground_speed, (int, float)) or ground_speed <= 0:
+            ground_speed = DEFAULT_GROUND_SPEED_KT
+        seconds = abs(distance - self.threshold_km) / (ground_speed * KNOTS_TO_KM_PER_SECOND)
+        if self._inside.get(hex_id, False) != (distance <= self.threshold_km):
+            # Crossing held back by the cooldown, check again once it expired.
+            seconds = self._last_event[hex_id] + self.cooldown - now
+        due_time = now + min(max(seconds, MIN_REEVALUATION_SECONDS), MAX_REEVALUATION_SECONDS)
+        self.enqueue(hex_id, due_time)
+
+    def enqueue(self, hex_id: str, due_time: float) -> None:
+        """Queue the next evaluation of an aircraft, replacing any earlier one.
+
+        Args:
+            hex_id (str): ICAO hex address of the aircraft.
+            due_time (float): Timestamp of the evaluation in seconds.
+        """
+        self._due[hex_id] = due_time
+        heapq.heappush(self._queue, (due_time, hex_id))
+
+    def lose(self, hex_id: str, now: float):
+        """Handle an aircraft that is no longer received at its re-evaluation.
+
+        An aircraft lost inside the threshold is announced as leaving it with an
+        unknown distance. Like any other crossing this is held back during the
+        cooldown of the previous event. The state of a lost aircraft is kept until
+        its cooldown expired, so a short dropout does not announce it again when
+        it reappears, and is dropped afterwards.
+
+        Args:
+            hex_id (str): ICAO hex address of the aircraft.
+            now (float): Timestamp of the poll in seconds.
+
+        Returns:
+            tuple | None: The (event_type, event_data) tuple or None if nothing changed.
+        """
+        self._lost.add(hex_id)
+        cooldown_end = self._last_event.get(hex_id, float("-inf")) + self.cooldown
+        if now < cooldown_end:
+            self.enqueue(hex_id, cooldown_end)
+            return None
+        if not self._inside.get(hex_id, False):
+            self.forget(hex_id)
+            return None
+        self._inside[hex_id] = False
+        self._last_event[hex_id] = now
+        self.enqueue(hex_id, now + self.cooldown)
+        return (
+            EVENT_PROXIMITY_EXITED,
+            {
+                "hex": hex_id,
+                "flight": self._flight_numbers.get(hex_id),
+                "distance": None,
+                "threshold": self.threshold_km,
+                "lost": True
+            }
+        )
+
+    def forget(self, hex_id: str) -> None:
+        """Drop all state of an aircraft that is no longer received.
+
+        Args:
+            hex_id (str): ICAO hex address of the aircraft.
+        """
+        self._due.pop(hex_id, None)
+        self._inside.pop(hex_id, None)
+        self._flight_numbers.pop(hex_id, None)
+        self._last_event.pop(hex_id, None)
+        self._lost.discard(hex_id)
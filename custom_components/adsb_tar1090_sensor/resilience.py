@@ -0,0 +1,141 @@
+"""
+CircuitBreaker and HealthMetrics classes to protect and monitor
+the connection to the ADS-B receiver.
+
+"""
+from __future__ import annotations
+import logging
+from collections import deque
+_LOGGER = logging.getLogger(__name__)
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+class CircuitBreaker:
+    """Stops polling a receiver after repeated failures and retries after a timeout."""
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        """Initialize the CircuitBreaker class.
+
+        Args:
+            failure_threshold (int): Consecutive failures before the circuit opens.
+            reset_timeout (float): Seconds to wait before a trial request is allowed.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.consecutive_failures = 0
+        self._opened_at: float | None = None
+
+    def state(self, now: float) -> str:
+        """Returns the state of the circuit.
+
+        Args:
+            now (float): Monotonic timestamp.
+
+        Returns:
+            str: One of `closed`, `open` or `half_open`.
+        """
+        if self._opened_at is None:
+            return CIRCUIT_CLOSED
+        if now - self._opened_at >= self.reset_timeout:
+            return CIRCUIT_HALF_OPEN
+        return CIRCUIT_OPEN
+
+    def allow_request(self, now: float) -> bool:
+        """Check if a request to the receiver may be sent.
+
+        Args:
+            now (float): Monotonic timestamp.
+
+        Returns:
+            bool: False while the circuit is open.
+        """
+        return self.state(now) != CIRCUIT_OPEN
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        if self._opened_at is not None:
+            _LOGGER.info("ADS-B receiver endpoint recovered, closing circuit.")
+        self.consecutive_failures = 0
+        self._opened_at = None
+
+    def record_failure(self, now: float) -> None:
+        """Count a failed request and open the circuit if the threshold is reached.
+
+        A failed trial request in the half-open state opens the circuit again.
+
+        Args:
+            now (float): Monotonic timestamp.
+        """
+        self.consecutive_failures += 1
+        if (
+            self._opened_at is not None
+            or self.consecutive_failures >= self.failure_threshold
+        ):
+            if self.state(now) != CIRCUIT_OPEN:
+                _LOGGER.warning(
+                    "ADS-B receiver endpoint failed %s times, pausing requests for %s seconds.",
+                    self.consecutive_failures,
+                    self.reset_timeout
+                )
+            self._opened_at = now
+
+
+class HealthMetrics:
+    """Counts polls and failures of the receiver connection per failure class."""
+
+    def __init__(self, window: int) -> None:
+        """Initialize the HealthMetrics class.
+
+        Args:
+            window (int): Amount of recent polls the error rate is calculated over.
+        """
+        self.polls = 0
+        self.errors: dict[str, int] = {}
+        self.skipped_records = 0
+        self._recent: deque[bool] = deque(maxlen=window)
+
+    @property
+    def error_rate(self) -> float:
+        """Returns the share of failed polls within the recent window.
+
+        Returns:
+            float: Error rate between 0 and 1.
+        """
+        if not self._recent:
+            return 0.0
+        return round(self._recent.count(False) / len(self._recent), 3)
+
+    def record_success(self, skipped_records: int = 0) -> None:
+        """Count a successful poll.
+
+        Args:
+            skipped_records (int): Malformed aircraft records skipped while parsing.
+        """
+        self.polls += 1
+        self.skipped_records += skipped_records
+        self._recent.append(True)
+
+    def record_error(self, failure_class: str) -> None:
+        """Count a failed poll.
+
+        Args:
+            failure_class (str): The kind of failure, such as `cannot_connect`.
+        """
+        self.polls += 1
+        self.errors[failure_class] = self.errors.get(failure_class, 0) + 1
+        self._recent.append(False)
+
+    def as_dict(self) -> dict:
+        """Returns the metrics as sensor attributes.
+        The poll counter is left out as it would change the attributes on every poll.
+
+        Returns:
+            dict: The health metrics.
+        """
+        return {
+            "errors": dict(self.errors),
+            "error_rate": self.error_rate,
+            "skipped_records": self.skipped_records
+        }
@@ -1,7 +1,6 @@
 """The Sensor class and definitions."""
 import logging
 from typing import Any, Dict, List, Optional
-import asyncio
 from datetime import timedelta
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -14,16 +13,33 @@ from homeassistant.const import (
     CONF_NAME
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from .utils import generate_entity_id
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator
+)
+from .utils import generate_entity_id, get_home_location
 from .connection_hub import ConnectionHub
 from .const import (
     CONF_URL,
+    CONF_EMERGENCY_SQUAWK,
+    CONF_SPECIAL_SQUAWK,
+    CONF_SQUAWK_EVENT_COOLDOWN,
+    CONF_UPDATE_INTERVAL,
+    CONF_NEARBY_FLIGHT_SLOTS,
+    CONF_DISTANCE_THRESHOLD,
+    CONF_PROXIMITY_EVENT_COOLDOWN,
+    DEFAULT_EMERGENCY_SQUAWK,
+    DEFAULT_SPECIAL_SQUAWK,
+    DEFAULT_SQUAWK_EVENT_COOLDOWN_SECONDS,
+    DEFAULT_UPDATE_INTERVAL_SECONDS,
+    DEFAULT_NEARBY_FLIGHT_SLOTS,
+    DEFAULT_DISTANCE_THRESHOLD_KM,
+    DEFAULT_PROXIMITY_EVENT_COOLDOWN_SECONDS,
     DOMAIN
 )
 
 _LOGGER = logging.getLogger(__name__)
-SCAN_INTERVAL = timedelta(minutes=5)
 SENSOR_PAYLOAD_KEYS = {
     "adsb_monitored_flights": "monitored_flights",
     "adsb_nearest_flight": "nearest_flight",
@@ -31,8 +47,35 @@ SENSOR_PAYLOAD_KEYS = {
     "adsb_nearest_flight_altitude": "nearest_flight_altitude",
     "adsb_nearest_flight_speed": "nearest_flight_speed",
     "adsb_message_count": "message_count",
-    "adsb_emergencies": "emergencies"
+    "adsb_emergencies": "emergencies",
+    "adsb_receiver_status": "receiver_status",
+    "adsb_flights_climbing": "flights_climbing",
+    "adsb_flights_descending": "flights_descending",
+    "adsb_flights_cruising": "flights_cruising",
+    "adsb_flights_approach": "flights_approach",
+    "adsb_flights_ground": "flights_ground"
+}
+# Minimum change of a numeric payload value before a new state is written.
+SENSOR_TOLERANCES = {
+    "nearest_flight_distance": 0.1,
+    "nearest_flight_altitude": 50,
+    "nearest_flight_speed": 0.01
+}
+# Minimum change of a nearby flight slot attribute before a new state is written.
+SLOT_ATTRIBUTE_TOLERANCES = {
+    "latitude": 0.01,
+    "longitude": 0.01,
+    "altitude": 50,
+    "speed": 5,
+    "distance": 0.1
 }
+# Payload keys exposed as (size-capped) list or dict attributes of a sensor.
+SENSOR_ATTRIBUTE_KEYS = {
+    "monitored_flights": "flights",
+    "emergencies": "squawk_alerts",
+    "receiver_status": "receiver_health"
+}
+MAX_ATTRIBUTE_ITEMS = 25
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -50,20 +93,65 @@ async def async_setup_entry(
     config = hass.data[DOMAIN][config_entry.entry_id]
     integration_name = config[CONF_NAME]
     url = config[CONF_URL]
-    session = ConnectionHub(hass, url)
+    options = config_entry.options or {}
+    session = ConnectionHub(
+        url,
+        location=get_home_location(hass),
+        fire_event=hass.bus.async_fire,
+        emergency_squawk=options.get(CONF_EMERGENCY_SQUAWK, DEFAULT_EMERGENCY_SQUAWK),
+        special_squawk=options.get(CONF_SPECIAL_SQUAWK, DEFAULT_SPECIAL_SQUAWK),
+        squawk_event_cooldown=options.get(
+            CONF_SQUAWK_EVENT_COOLDOWN,
+            DEFAULT_SQUAWK_EVENT_COOLDOWN_SECONDS
+        ),
+        nearby_flight_slots=options.get(
+            CONF_NEARBY_FLIGHT_SLOTS,
+            DEFAULT_NEARBY_FLIGHT_SLOTS
+        ),
+        distance_threshold=options.get(
+            CONF_DISTANCE_THRESHOLD,
+            DEFAULT_DISTANCE_THRESHOLD_KM
+        ),
+        proximity_event_cooldown=options.get(
+            CONF_PROXIMITY_EVENT_COOLDOWN,
+            DEFAULT_PROXIMITY_EVENT_COOLDOWN_SECONDS
+        )
+    )
+    update_interval = timedelta(
+        seconds=options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL_SECONDS)
+    )
+    coordinator = DataUpdateCoordinator(
+        hass,
+        _LOGGER,
+        name=integration_name,
+        update_method=session.async_update,
+        update_interval=update_interval
+    )
+    await coordinator.async_refresh()
     entities = []
     for sensor_name, payload_key in SENSOR_PAYLOAD_KEYS.items():
         entities.append(
             ADSBTar1090Sensor(
                 hass,
+                coordinator,
                 integration_name,
                 sensor_name,
                 session,
                 payload_key
             )
         )
+    for slot in range(session.flight_slots.size):
+        entities.append(
+            ADSBNearbyFlightSensor(
+                hass,
+                coordinator,
+                integration_name,
+                session,
+                slot
+            )
+        )
     if entities:
-        async_add_entities(entities, update_before_add=True)
+        async_add_entities(entities)
 
 # async def async_setup_platform(
 #     hass: HomeAssistant,
@@ -73,13 +161,15 @@ async def async_setup_entry(
 # ) -> None:
 #     """Set up the sensor platform for the custom component.
 #     This function is responsible for setting up the sensor platform within the custom component.
-#     Called when Home Assistant discovers and initializes the sensor platform based on configuration.
+#     Called when Home Assistant discovers and initializes the sensor platform
+#     based on configuration.
 
 #     Args:
 #         hass (HomeAssistant): The Home Assistant core instance.
 #         config (Dict[str, Any]): The configuration for the sensor platform.
 #         async_add_entities (Callable[[List[Entity], bool]): A function to add entities to HA.
-#         discovery_info (Optional[Dict[str, Any]]): Optional discovery information. Defaults to None.
+#         discovery_info (Optional[Dict[str, Any]]): Optional discovery information.
+#         Defaults to None.
 #     """
 #     if discovery_info is None:
 #         _LOGGER.debug("No discovery info available.")
@@ -95,28 +185,29 @@ async def async_setup_entry(
 #         async_add_entities(entities)
 
 
-async def async_update_entities(entities: list):
-    """Asynchronously updates the state of multiple entities at specified intervals.
+class ADSBTar1090Sensor(CoordinatorEntity, SensorEntity):
+    """Representation of a sensor for ADS-B data retrieved from tar1090 API.
 
-    This function iterates indefinitely, updating the state of each entity in the provided list
-    at intervals determined by the SCAN_INTERVAL constant.
-
-    Args:
-        entities (list): A list of Entity objects whose state needs to be updated.
+    The coordinator fetches the ADS-B data once per update interval for all sensors
+    of a config entry, each sensor decides on its own whether the new value is
+    worth a state write.
     """
-    while True:
-        await asyncio.sleep(SCAN_INTERVAL.total_seconds())
-        await asyncio.gather(*[entity.async_update() for entity in entities])
-
-
-class ADSBTar1090Sensor(SensorEntity):
-    """Representation of a sensor for ADS-B data retrieved from tar1090 API."""
     _attr_entity_category = (
         EntityCategory.DIAGNOSTIC
     )
+    _attribute_tolerances: dict = {}
+    _unrecorded_attributes = frozenset({
+        "flights",
+        "squawk_alerts",
+        "truncated_items",
+        "data_age",
+        "suppressed_writes"
+    })
+
     def __init__(
         self,
         hass: HomeAssistant,
+        coordinator: DataUpdateCoordinator,
         integration_name: str,
         name: str,
         rest_data: ConnectionHub,
@@ -126,16 +217,22 @@ class ADSBTar1090Sensor(SensorEntity):
 
         Args:
             hass (HomeAssistant): The Home Assistant core instance.
+            coordinator (DataUpdateCoordinator): Coordinator refreshing the ConnectionHub.
             name (str): Name of the sensor.
             rest_data (ConnectionHub): ConnectionHub instance for fetching data.
             payload_keys (List[str]): List of keys in the payload representing sensor data.
         """
+        super().__init__(coordinator)
         self._hass = hass
         self._name = name
         self._attr_unique_id = generate_entity_id(DOMAIN, integration_name, name)
         self._rest_data = rest_data
         self._payload_key = payload_key
-        self._state = None
+        self._tolerance = SENSOR_TOLERANCES.get(payload_key)
+        self._attribute_key = SENSOR_ATTRIBUTE_KEYS.get(payload_key)
+        self._attr_native_value = None
+        self._attributes = {}
+        self.update_from_data()
 
     @property
     def icon(self) -> str | None:
@@ -147,14 +244,183 @@ class ADSBTar1090Sensor(SensorEntity):
         """Return the name of the sensor."""
         return self._name
 
-    async def async_update(self):
-        """Update the sensor state."""
-        _LOGGER.debug("ADS-B tar1090 Sensor: Updating Sensor.")
-        await self._rest_data.async_update()
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the state attributes of the sensor."""
+        return self._attributes
+
+    def value_changed(self, current_value: Any) -> bool:
+        """Check if a new value differs enough from the current state to be written.
+
+        Args:
+            current_value (Any): The new value from the ADS-B payload.
+
+        Returns:
+            bool: True if the value changed beyond the sensor tolerance.
+        """
+        previous_value = self._attr_native_value
+        if (
+            self._tolerance is not None
+            and isinstance(current_value, (int, float))
+            and isinstance(previous_value, (int, float))
+        ):
+            return abs(current_value - previous_value) >= self._tolerance
+        return current_value != previous_value
+
+    def attributes_changed(self, attributes: dict) -> bool:
+        """Check if new attributes differ enough from the current ones to be written.
+
+        Args:
+            attributes (dict): The new state attributes.
+
+        Returns:
+            bool: True if any attribute changed beyond its tolerance.
+        """
+        if attributes.keys() != self._attributes.keys():
+            return True
+        for key, value in attributes.items():
+            previous_value = self._attributes[key]
+            tolerance = self._attribute_tolerances.get(key)
+            if (
+                tolerance is not None
+                and isinstance(value, (int, float))
+                and isinstance(previous_value, (int, float))
+            ):
+                if abs(value - previous_value) >= tolerance:
+                    return True
+            elif value != previous_value:
+                return True
+        return False
+
+    def extract_value(self, data: dict) -> Any:
+        """Extract the sensor value from the ConnectionHub data.
+
+        Args:
+            data (dict): The ADS-B payload of the ConnectionHub.
+
+        Returns:
+            Any: The sensor value.
+        """
+        return data.get(self._payload_key)
+
+    def build_attributes(self, data: dict) -> dict:
+        """Build the size-capped list or dict attribute of the sensor, if it has one.
+
+        Args:
+            data (dict): The ADS-B payload of the ConnectionHub.
+
+        Returns:
+            dict: The state attributes.
+        """
+        if not self._attribute_key:
+            return {}
+        items = data.get(self._attribute_key) or []
+        if isinstance(items, dict):
+            return dict(items)
+        return {
+            self._attribute_key: items[:MAX_ATTRIBUTE_ITEMS],
+            "truncated_items": max(len(items) - MAX_ATTRIBUTE_ITEMS, 0)
+        }
+
+    def update_from_data(self) -> bool:
+        """Update the sensor value from the ConnectionHub data.
+
+        Returns:
+            bool: True if the state or the attributes changed and need to be written.
+        """
         data = self._rest_data.data
-        _LOGGER.debug("Got sensor data: %s", str(data))
-        if data:
-            current_value = data.get(self._payload_key)
-            _LOGGER.debug("Current Vallue: %s", str(current_value))
-            if current_value:
-                self._state = current_value
+        if not data:
+            return False
+        current_value = self.extract_value(data)
+        attributes = self.build_attributes(data)
+        _LOGGER.debug("Current value: %s", str(current_value))
+        if not self.value_changed(current_value) and not self.attributes_changed(attributes):
+            return False
+        self._attr_native_value = current_value
+        self._attributes = attributes
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the sensor state if the ConnectionHub data changed it.
+        Skipped writes are counted on the ConnectionHub shared by all sensors.
+        """
+        if self.update_from_data():
+            self.async_write_ha_state()
+        else:
+            self._rest_data.suppressed_writes += 1
+
+
+class ADSBNearbyFlightSensor(ADSBTar1090Sensor):
+    """Representation of one slot of the nearby flights entity pool.
+
+    Slots are reused for whichever aircraft currently ranks among the nearest,
+    so the amount of entities stays fixed.
+    """
+    _attr_entity_category = None
+    _attribute_tolerances = SLOT_ATTRIBUTE_TOLERANCES
+    _unrecorded_attributes = frozenset({
+        "hex",
+        "latitude",
+        "longitude",
+        "altitude",
+        "speed",
+        "squawk",
+        "distance"
+    })
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: DataUpdateCoordinator,
+        integration_name: str,
+        rest_data: ConnectionHub,
+        slot: int
+    ) -> None:
+        """Initialize the nearby flight sensor.
+
+        Args:
+            hass (HomeAssistant): The Home Assistant core instance.
+            coordinator (DataUpdateCoordinator): Coordinator refreshing the ConnectionHub.
+            integration_name (str): Name of the integration instance.
+            rest_data (ConnectionHub): ConnectionHub instance for fetching data.
+            slot (int): Zero-based index of the slot in the entity pool.
+        """
+        self._slot = slot
+        super().__init__(
+            hass,
+            coordinator,
+            integration_name,
+            f"adsb_nearby_flight_{slot + 1}",
+            rest_data,
+            "flight_slots"
+        )
+
+    def get_slot_flight(self, data: dict) -> dict | None:
+        """Return the flight details assigned to this slot.
+
+        Args:
+            data (dict): The ADS-B payload of the ConnectionHub.
+
+        Returns:
+            dict | None: The flight details or None if the slot is unused.
+        """
+        flight_slots = data.get(self._payload_key) or []
+        if self._slot < len(flight_slots):
+            return flight_slots[self._slot]
+        return None
+
+    def extract_value(self, data: dict) -> Any:
+        """Extract the flight number of the aircraft assigned to this slot."""
+        flight = self.get_slot_flight(data)
+        return flight["flight"] if flight else None
+
+    def build_attributes(self, data: dict) -> dict:
+        """Build the position, altitude, speed, squawk and distance attributes."""
+        attributes = super().build_attributes(data)
+        flight = self.get_slot_flight(data)
+        if flight:
+            attributes.update(
+                {key: value for key, value in flight.items() if key != "flight"}
+            )
+        return attributes
@@ -0,0 +1,97 @@
+"""
+SquawkEventTracker class to detect aircraft that start or stop squawking
+an emergency or special transponder code.
+
+"""
+from __future__ import annotations
+import logging
+import time
+from .const import (
+    EVENT_SQUAWK_STARTED,
+    EVENT_SQUAWK_ENDED
+)
+_LOGGER = logging.getLogger(__name__)
+
+class SquawkState:
+    """Compact per-aircraft record of the last announced squawk state."""
+    __slots__ = ("signature", "last_event", "event_data")
+
+    def __init__(self, signature: tuple | None, last_event: float, event_data: dict) -> None:
+        """Initialize the SquawkState record.
+
+        Args:
+            signature (tuple | None): Tuple of category and squawk code,
+            or None if the aircraft is no longer alerting.
+            last_event (float): Monotonic timestamp of the last fired event.
+            event_data (dict): The data of the last fired `started` event.
+        """
+        self.signature = signature
+        self.last_event = last_event
+        self.event_data = event_data
+
+
+class SquawkEventTracker:
+    """Keeps track of alerting aircraft across polls and deduplicates events."""
+
+    def __init__(self, cooldown: float) -> None:
+        """Initialize the SquawkEventTracker class.
+
+        Args:
+            cooldown (float): Minimum amount of seconds between two events
+            for the same aircraft.
+        """
+        self.cooldown = cooldown
+        self._table: dict[str, SquawkState] = {}
+
+    @property
+    def active(self) -> dict:
+        """Returns the event data of all currently alerting aircraft.
+
+        Returns:
+            dict: Event data of alerting aircraft keyed by ICAO hex address.
+        """
+        return {
+            hex_id: state.event_data
+            for hex_id, state in self._table.items()
+            if state.signature is not None
+        }
+
+    def update(self, squawk_alerts: dict, now: float | None = None) -> list:
+        """Compare the alerting aircraft of the current poll with the tracked state.
+
+        Only aircraft that are alerting now or are present in the tracking table
+        are visited. A state change within the cooldown of the previous event is
+        not announced and will be re-evaluated on the next poll.
+
+        Args:
+            squawk_alerts (dict): Event data of alerting aircraft keyed by ICAO hex address,
+            as built by `FlightManager.analyze_squawk`.
+            now (float | None): Monotonic timestamp of this poll. Defaults to `time.monotonic()`.
+
+        Returns:
+            list: List of (event_type, event_data) tuples to fire.
+        """
+        if now is None:
+            now = time.monotonic()
+        events = []
+        for hex_id in set(squawk_alerts) | set(self._table):
+            alert = squawk_alerts.get(hex_id)
+            new_signature = (alert["category"], alert["squawk"]) if alert else None
+            state = self._table.get(hex_id)
+            current_signature = state.signature if state else None
+            if new_signature == current_signature:
+                if state and not new_signature and now - state.last_event >= self.cooldown:
+                    del self._table[hex_id]
+                continue
+            if state and now - state.last_event < self.cooldown:
+                _LOGGER.debug("Suppressing squawk event for %s during cooldown.", hex_id)
+                continue
+            if state and current_signature:
+                events.append((EVENT_SQUAWK_ENDED, state.event_data))
+            if alert:
+                events.append((EVENT_SQUAWK_STARTED, alert))
+                self._table[hex_id] = SquawkState(new_signature, now, alert)
+            else:
+                state.signature = None
+                state.last_event = now
+        return events
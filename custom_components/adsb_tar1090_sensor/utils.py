@@ -1,7 +1,24 @@
 """Provide generic utility functions."""
+from __future__ import annotations
 
 def generate_entity_id(domain: str, integration_name: str, entity_name: str) -> str:
     """Generate a unique entity ID."""
     integration = integration_name.lower().replace(' ','_')
     entity = entity_name.lower().replace(' ', '_')
     return f"{domain}_{integration}_{entity}"
+
+def get_home_location(hass) -> tuple | None:
+    """Retrieve the latitude and longitude of the Home Assistant installation.
+
+    Args:
+        hass (HomeAssistant): The Home Assistant core instance.
+
+    Returns:
+        tuple | None: A tuple containing the latitude and longitude of the Home Assistant
+        installation. If the location is not available, None is returned.
+    """
+    latitude = hass.config.latitude
+    longitude = hass.config.longitude
+    if latitude is None or longitude is None:
+        return None
+    return (latitude, longitude)
@@ -0,0 +1,98 @@
+"""Measure the cold-start import cost of the ADS-B tar1090 Sensor integration.
+
+Runs a fresh interpreter with `-X importtime` for each entry point Home Assistant
+imports and reports the cumulative import time of the integration modules.
+Modules that are meant to be lazy-loaded must not show up during startup.
+
+Usage:
+    python scripts/benchmark_import.py [--runs 5] [--max-ms 50]
+"""
+from __future__ import annotations
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PACKAGE = "custom_components.adsb_tar1090_sensor"
+ENTRY_POINTS = [PACKAGE, f"{PACKAGE}.config_flow"]
+LAZY_MODULES = ["haversine", f"{PACKAGE}.squawk_codes"]
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def measure_import(module: str) -> tuple[float, set]:
+    """Import a module in a fresh interpreter and parse the `-X importtime` report.
+
+    Args:
+        module (str): Dotted name of the module to import.
+
+    Raises:
+        ImportError: The module failed to import, with the traceback of the interpreter.
+
+    Returns:
+        tuple[float, set]: Cumulative import time of the integration modules in
+        milliseconds and the names of all imported modules.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=False
+    )
+    if result.returncode != 0:
+        traceback = [
+            line for line in result.stderr.splitlines() if not line.startswith("import time:")
+        ]
+        raise ImportError("\n".join(traceback), name=module)
+    imported = set()
+    cumulative_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        (_, cumulative, name) = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        nested = name[1:] != name.lstrip()
+        name = name.strip()
+        imported.add(name)
+        # Outermost imports already include everything they pulled in.
+        if not nested and name.startswith(PACKAGE.split(".", maxsplit=1)[0]):
+            cumulative_us += int(cumulative)
+    return (cumulative_us / 1000, imported)
+
+
+def main() -> int:
+    """Run the import benchmark and report the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per entry point.")
+    parser.add_argument("--max-ms", type=float, help="Fail if the median exceeds this budget.")
+    args = parser.parse_args()
+
+    failed = False
+    for module in ENTRY_POINTS:
+        timings = []
+        imported = set()
+        try:
+            for _ in range(args.runs):
+                (elapsed_ms, imported) = measure_import(module)
+                timings.append(elapsed_ms)
+        except ImportError as exc:
+            print(f"{module}: import failed")
+            print(f"  {exc}".replace("\n", "\n  "))
+            failed = True
+            continue
+        median_ms = statistics.median(timings)
+        print(f"{module}: median {median_ms:.1f} ms, min {min(timings):.1f} ms")
+        eager = [name for name in LAZY_MODULES if name in imported]
+        if eager:
+            print(f"  eagerly imported: {', '.join(eager)}")
+            failed = True
+        if args.max_ms is not None and median_ms > args.max_ms:
+            print(f"  exceeds budget of {args.max_ms:.1f} ms")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())